@@ -5,218 +5,658 @@ Extracts comments, replies, and user information from public TikTok videos.
 """
 
 import argparse
+import asyncio
 import csv
+import functools
 import json
+import logging
+import os
 import random
 import re
-import time
 import sys
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
-from urllib.parse import urlparse
+
+logger = logging.getLogger('tiktok_scraper')
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-    import pandas as pd
+    from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 except ImportError as e:
     print(f"Error: Missing required package. Please install dependencies with: pip install -r requirements.txt")
     print(f"Details: {e}")
     sys.exit(1)
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    _HAVE_LXML = True
+except ImportError:
+    _HAVE_LXML = False
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+try:
+    import httpx
+    _HAVE_HTTPX = True
+except ImportError:
+    _HAVE_HTTPX = False
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize with orjson when available, stdlib json otherwise."""
+    if _HAVE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _load_json_bytes(raw: bytes):
+    """Deserialize with orjson when available, stdlib json otherwise."""
+    if _HAVE_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Matches like counts such as "152", "1.2K", "5M" — compiled once so the
+# per-comment validation is a single DFA scan with no intermediate strings
+_LIKES_RE = re.compile(r'^\d+(?:[.,]\d+)?[KMB]?$', re.IGNORECASE)
+
+# Anchored TikTok video URL validator — one scan instead of urlparse plus
+# substring checks, which matters when validating thousands of batch URLs.
+# Accepts canonical /@user/video/<id> URLs, /t/ short links, and the bare
+# share codes vm./vt. hosts use (https://vm.tiktok.com/<code>/).
+_TIKTOK_URL_RE = re.compile(
+    r'^https?://(?:'
+    r'(?:vm|vt)\.tiktok\.com/[\w-]+'
+    r'|(?:www\.|m\.)?tiktok\.com/(?:@[\w.-]+/video/\d+|v/\d+|t/[\w-]+|.+?/video/\d+)'
+    r')',
+    re.IGNORECASE)
+
+# Compound selector for top-level comment wrappers — CSS comma-union lets one
+# query cover the hashed class, the unhashed fallback, and the generic
+# data-e2e hook instead of probing each selector in its own round-trip
+_COMMENT_WRAPPER_SEL = ('.css-1mzopna-7937d88b--DivCommentObjectWrapper, '
+                        'div[class*="DivCommentObjectWrapper"], '
+                        '[data-e2e="comment-item"]')
+
+# Relative/absolute timestamp fallback, e.g. "2h ago" or "2024-01-15"
+_TIME_RE = re.compile(r'\d+[smhd]\s*ago|\d+-\d+-\d+')
+
+# Precompiled XPath expressions for the lxml harvest path. libxml2 parses the
+# whole snapshot in-process, so per-comment field extraction costs C-level
+# node walks instead of driver round-trips.
+if _HAVE_LXML:
+    # One shared parser instance — avoids rebuilding libxml2 parser state
+    # (and churning it through the GC) on every snapshot
+    _LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+    _XPATH_TOP = etree.XPath("//div[contains(@class, 'DivCommentObjectWrapper')]")
+    _XPATH_USER = etree.XPath(".//p[contains(@class, 'TUXText--weight-medium')]")
+    _XPATH_TEXT = etree.XPath(".//*[@data-e2e='comment-text']")
+    _XPATH_LIKES = etree.XPath(".//span[contains(@style, '--ui-text-3')]")
+    _XPATH_TIME = etree.XPath(".//time | .//*[@datetime]")
+    _XPATH_REPLIES = etree.XPath(".//div[contains(@class, 'DivCommentItemWrapper')]")
+
+
+# One match + dict lookup beats the upper()/replace() branch chain in the
+# per-comment hot path.
+_NUM_RE = re.compile(r'([\d.]+)\s*([kKmMbB]?)')
+_NUM_MULT = {'': 1, 'k': 1_000, 'K': 1_000, 'm': 1_000_000, 'M': 1_000_000,
+             'b': 1_000_000_000, 'B': 1_000_000_000}
+# Comma followed by exactly three digits is a thousands separator ("1,234");
+# any other comma is a locale decimal mark ("3,4K")
+_THOUSANDS_RE = re.compile(r'\d,\d{3}(?!\d)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_number(text: str) -> int:
+    """
+    Parse number text that might include K, M, B suffixes.
+    Memoized: like counts cluster on round values ("1.2K", "5K"), so most
+    calls during a scrape are cache hits.
+
+    Args:
+        text: Stripped number string like "1.2K" or "5M"
+
+    Returns:
+        Parsed integer value
+    """
+    if not text:
+        return 0
+
+    # The like-count validators accept comma forms, so normalize them
+    # before matching: "1,234" -> "1234", "3,4K" -> "3.4K"
+    if ',' in text:
+        text = text.replace(',', '') if _THOUSANDS_RE.search(text) else text.replace(',', '.')
+
+    match = _NUM_RE.search(text)
+    if not match:
+        return 0
+
+    try:
+        return int(float(match.group(1)) * _NUM_MULT[match.group(2)])
+    except (ValueError, TypeError):
+        return 0
+
+# JavaScript run inside the page to click every "View replies" button in one
+# pass, instead of one CDP round-trip per comment.
+_EXPAND_REPLIES_JS = """
+() => {
+    let clicked = 0;
+    // Only un-expanded wrappers: each one is clicked on at most one tick,
+    // so the caller knows a clicked tick means replies are still rendering
+    const wrappers = document.querySelectorAll(
+        '.css-1mzopna-7937d88b--DivCommentObjectWrapper:not([data-scraper-expanded]), ' +
+        'div[class*="DivCommentObjectWrapper"]:not([data-scraper-expanded])'
+    );
+    wrappers.forEach(wrapper => {
+        let hit = false;
+        wrapper.querySelectorAll('button').forEach(btn => {
+            // "View 3 replies" / "View more replies" only — never "Hide
+            // replies" (would collapse what the last tick expanded) and
+            // never the bare "Reply" composer button
+            if (/^view/i.test(btn.innerText.trim())) {
+                btn.click();
+                hit = true;
+                clicked += 1;
+            }
+        });
+        if (hit) wrapper.dataset.scraperExpanded = '1';
+    });
+    return clicked;
+}
+"""
+
+# Launch flags used by every Chromium we start: drop the automation banner,
+# keep timers/rendering unthrottled when the window is backgrounded, and
+# avoid /dev/shm exhaustion in containers.
+_CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-background-networking',
+    '--mute-audio',
+]
+
+async def _retry_async(coro_factory, tries: int = 3, base: float = 1.0, label: str = 'operation'):
+    """
+    Await coro_factory() with exponential backoff and jitter between tries.
+    A flaky navigation or wait gets a couple of progressively spaced retries
+    instead of wasting a whole batch slot on one slow scrape.
+
+    Args:
+        coro_factory: Zero-argument callable returning a fresh awaitable
+        tries: Total number of attempts
+        base: Base delay in seconds, doubled per attempt with ±20% jitter
+        label: Human-readable name for log lines
+
+    Returns:
+        Whatever the awaitable resolves to
+
+    Raises:
+        The last Playwright error if every attempt fails
+    """
+    for attempt in range(tries):
+        try:
+            return await coro_factory()
+        except (PlaywrightTimeoutError, PlaywrightError) as e:
+            if attempt == tries - 1:
+                raise
+            delay = base * (2 ** attempt) * random.uniform(0.8, 1.2)
+            logger.warning(f"Warning: {label} failed ({e}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+
+# Serializes interactive CAPTCHA prompts so concurrent scrapes take turns at
+# the terminal instead of racing for the same stdin
+_CAPTCHA_PROMPT_LOCK = asyncio.Lock()
+
+# Resource types and URL fragments that never carry comment data — the video
+# stream, thumbnails, fonts, and analytics beacons account for most of the
+# page weight, so aborting them cuts load time and bandwidth dramatically.
+# Stylesheets stay enabled so the CAPTCHA UI renders legibly; the class-name
+# selectors used for extraction don't depend on computed style.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+_BLOCKED_URL_SNIPPETS = ('google-analytics', 'doubleclick', 'sentry.io',
+                         'tiktokcdn-us.com/obj/tos-')
+# Never block these: the verification challenge is built out of image
+# resources (slider/puzzle/rotate pieces) served from the security CDNs, so
+# aborting them would leave --solve-captcha users an empty verify box
+_CAPTCHA_ALLOW_SNIPPETS = ('captcha', 'verification', '-security.', 'security-')
+
+# CAPTCHA overlay selectors, pre-joined so detection is a single query
+# instead of one locator round-trip per candidate
+_CAPTCHA_SEL = ', '.join((
+    '[id*="captcha"]',
+    '[class*="captcha"]',
+    '[data-e2e*="captcha"]',
+    'iframe[src*="captcha"]',
+    '.captcha_verify_container',
+    'div[class*="verify-wrap"]',
+))
+
+# Keywords the CAPTCHA overlay text tends to contain; two or more hits in the
+# visible text is treated as a CAPTCHA even when the selectors miss
+_CAPTCHA_KEYWORDS = frozenset({'verify', 'captcha', 'robot', 'verification', 'puzzle', 'challenge'})
+
+# Comment-list XHR endpoint fragment. The page fetches comments from this API
+# as structured JSON, which is far cheaper to consume than the rendered DOM —
+# capturing these responses skips hydration and DOM traversal entirely.
+_COMMENT_API_SNIPPET = '/api/comment/list'
+
+# Wrapper selectors tried in order inside the page: the first one that
+# matches anything wins, mirroring the baseline's fallback loop. A CSS union
+# would count comments twice wherever the data-e2e hook sits nested inside a
+# DivCommentObjectWrapper. Embedded in every script that lists wrappers.
+_WRAPPER_SELS_JS = """
+const WRAPPER_SELS = [
+    '.css-1mzopna-7937d88b--DivCommentObjectWrapper',
+    'div[class*="DivCommentObjectWrapper"]',
+    '[data-e2e="comment-item"]'
+];
+const pickWrappers = () => {
+    for (const sel of WRAPPER_SELS) {
+        const els = document.querySelectorAll(sel);
+        if (els.length) return Array.from(els);
+    }
+    return [];
+};
+"""
+
+# Init script: stamp each new comment wrapper once via MutationObserver and
+# keep a running total in window.__scraperLatest, so the scroll loops read a
+# plain integer instead of re-walking the whole container every tick.
+_COUNT_INIT_JS = _WRAPPER_SELS_JS + """
+const __scraperStamp = () => {
+    pickWrappers().forEach(el => {
+        if (!el.dataset.scraperIdx) {
+            el.dataset.scraperIdx = (window.__scraperLatest = (window.__scraperLatest || 0) + 1);
+        }
+    });
+};
+const __scraperObserver = new MutationObserver(__scraperStamp);
+const __scraperStart = () => {
+    const container = document.querySelector('.TUXTabBar-content');
+    if (container) {
+        __scraperObserver.observe(container, {childList: true, subtree: true});
+        __scraperStamp();
+    } else {
+        setTimeout(__scraperStart, 200);
+    }
+};
+__scraperStart();
+"""
+
+# One scroll tick: nudge the comments container, then poll the observer-
+# maintained counter every 150ms and resolve as soon as it grows (bounded at
+# 3s), so a tick costs ~200ms on a fast network instead of a fixed beat.
+# The streaming extractor harvests new comments between ticks.
+_SCROLL_TICK_JS = """
+async () => {
+""" + _WRAPPER_SELS_JS + """
+    const count = () => window.__scraperLatest || pickWrappers().length;
+    const container = document.querySelector('.TUXTabBar-content');
+    const before = count();
+    if (container) container.scrollBy(0, 1000);
+    const deadline = Date.now() + 3000;
+    let n = before;
+    while (Date.now() < deadline) {
+        await new Promise(r => setTimeout(r, 150));
+        n = count();
+        if (n > before) break;
+    }
+    return n;
+}
+"""
+
+# Serialize only the comment wrappers past the seen index — one small
+# evaluate instead of re-shipping the whole page via page.content() per tick
+_WRAPPER_HTML_JS = """
+(start) => {
+""" + _WRAPPER_SELS_JS + """
+    return pickWrappers().slice(start).map(el => el.outerHTML);
+}
+"""
+
+# JavaScript run inside the page to extract comments (and their replies) in a
+# single call, starting from the given wrapper index so already-harvested
+# comments are not re-walked. Walking the DOM in-browser avoids the 5-10
+# query_selector + inner_text round-trips per comment that the old per-field
+# extraction paid.
+_EXTRACT_COMMENTS_JS = """
+(start) => {
+""" + _WRAPPER_SELS_JS + """
+    // Comma-joined fallback selectors: querySelector returns the first
+    // DOM-order match, so each field costs one query instead of a loop
+    const USER_SEL = 'p.TUXText--weight-medium[style*="font-size: 14px"], ' +
+        'p.css-u0d6t3-7937d88b--StyledTUXText, p.TUXText.TUXText--weight-medium';
+    const TEXT_SEL = 'span[data-e2e="comment-text"], p[data-e2e="comment-text"], ' +
+        'span.TUXText:not([style*="color: var(--ui-text-3)"])';
+    const LIKES_SEL = 'span.TUXText--weight-normal[style*="color: var(--ui-text-3)"], ' +
+        'span.TUXText[style*="color: var(--ui-text-3)"][style*="font-size: 14px"]';
+
+    const pick = (root, sel) => {
+        const el = root.querySelector(sel);
+        return el ? el.innerText : '';
+    };
+
+    // Only accept like-count candidates that actually look like a number
+    // (not "Reply" or other gray text), so Python gets clean values back
+    const LIKES_RE = /^\\d+(?:[.,]\\d+)?[KMB]?$/i;
+    const pickLikes = (root) => {
+        for (const el of root.querySelectorAll(LIKES_SEL)) {
+            if (LIKES_RE.test(el.innerText.trim())) return el.innerText.trim();
+        }
+        return '';
+    };
+
+    const timestampOf = (wrapper) => {
+        const t = wrapper.querySelector('time, [datetime]');
+        if (t) return t.getAttribute('datetime') || t.innerText;
+        const match = wrapper.innerText.match(/\\d+[smhd]\\s*ago|\\d+-\\d+-\\d+/);
+        return match ? match[0] : '';
+    };
+
+    const wrappers = pickWrappers().slice(start || 0);
+    const out = [];
+    wrappers.forEach(wrapper => {
+        const comment = {
+            username: pick(wrapper, USER_SEL) || 'Unknown',
+            comment_text: pick(wrapper, TEXT_SEL),
+            likes: pickLikes(wrapper),
+            timestamp: timestampOf(wrapper),
+            replies: []
+        };
+        const replyEls = wrapper.querySelectorAll(
+            '.css-7waxo-7937d88b--DivCommentItemWrapper, div[class*="DivCommentItemWrapper"]'
+        );
+        replyEls.forEach(replyEl => {
+            comment.replies.push({
+                username: pick(replyEl, USER_SEL) || 'Unknown',
+                comment_text: pick(replyEl, TEXT_SEL),
+                likes: pickLikes(replyEl)
+            });
+        });
+        out.push(comment);
+    });
+    return out;
+}
+"""
+
+
+async def _block_heavy_requests(route):
+    """
+    Abort heavy asset and tracker requests before they hit the wire;
+    the scraper only needs the comment DOM, not pixels or beacons.
+
+    Args:
+        route: Playwright route object
+    """
+    request = route.request
+    if any(snippet in request.url for snippet in _CAPTCHA_ALLOW_SNIPPETS):
+        await route.continue_()
+        return
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    if any(snippet in request.url for snippet in _BLOCKED_URL_SNIPPETS):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+# Context settings shared by pooled contexts and persistent profiles
+_CONTEXT_KWARGS = {
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York',
+}
+
+
+async def _prepare_context(context):
+    """
+    Wire the scraper's init scripts and request blocking into a context.
+
+    Args:
+        context: Playwright browser context
+
+    Returns:
+        The same context, configured
+    """
+    # Advertise brotli: the comment-list JSON compresses ~20-25% smaller
+    # with br than gzip, which adds up across a long scroll
+    await context.set_extra_http_headers({
+        'Accept-Encoding': 'br, gzip, deflate',
+        'Accept-Language': 'en-US,en;q=0.9',
+    })
+    # Hide the webdriver flag that anti-bot scripts check first
+    await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    # Maintain the O(1) comment counter used by the scroll loops
+    await context.add_init_script(_COUNT_INIT_JS)
+    await context.route('**/*', _block_heavy_requests)
+    return context
+
+
+async def new_scraper_context(browser, storage_state: Optional[Dict] = None):
+    """
+    Create a browser context with the scraper's standard settings and
+    request blocking already wired up.
+
+    Args:
+        browser: Playwright browser object
+        storage_state: Optional storage state dict from a saved session
+
+    Returns:
+        Configured Playwright browser context
+    """
+    context = await browser.new_context(storage_state=storage_state, **_CONTEXT_KWARGS)
+    return await _prepare_context(context)
+
+
+class BrowserPool:
+    """
+    Pool of pre-warmed Chromium instances reused across scrape() calls.
+
+    Launching Chromium costs a couple of seconds of cold start per URL; the
+    pool amortizes that by handing out live browsers from an asyncio.Queue
+    and recycling each one after max_uses scrapes (or on failure). Each entry
+    also carries a warm context so HTTP/2 connections and TLS state to
+    tiktok.com survive between scrapes — only cookies are cleared on release.
+    """
+
+    def __init__(self, playwright, size: int = 4, max_uses: int = 50, headless: bool = True):
+        """
+        Initialize the browser pool.
+
+        Args:
+            playwright: Started async_playwright instance
+            size: Number of browsers kept warm
+            max_uses: Scrapes per browser before it is recycled
+            headless: Launch pooled browsers in headless mode
+        """
+        self.playwright = playwright
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self._queue = asyncio.Queue()
+
+    async def warmup(self):
+        """Launch all pooled browsers concurrently and fill the queue."""
+        entries = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        for entry in entries:
+            self._queue.put_nowait(entry)
+        logger.info(f"✓ Browser pool warmed up ({self.size} browsers)")
+
+    async def _launch(self) -> Dict:
+        """Launch one browser with a warm context and wrap them with a use counter."""
+        browser = await self.playwright.chromium.launch(headless=self.headless, args=_CHROMIUM_ARGS)
+        context = await new_scraper_context(browser)
+        return {'browser': browser, 'context': context, 'uses': 0}
+
+    async def acquire(self) -> Dict:
+        """
+        Take a browser from the pool, replacing it first if it died.
+
+        Returns:
+            Pool entry dict with 'browser', 'context' and 'uses' keys
+        """
+        entry = await self._queue.get()
+        # Health-check: replace dead browsers before handing them out
+        if not entry['browser'].is_connected():
+            try:
+                await entry['browser'].close()
+            except Exception:
+                pass
+            entry = await self._launch()
+        return entry
+
+    async def release(self, entry: Dict, broken: bool = False):
+        """
+        Return a browser to the pool, recycling it if worn out or broken.
+        Healthy entries keep their context (and its live connections to
+        tiktok.com); only cookies are cleared between uses.
+
+        Args:
+            entry: Pool entry from acquire()
+            broken: True if the scrape using this browser raised
+        """
+        entry['uses'] += 1
+        if broken or entry['uses'] >= self.max_uses:
+            try:
+                await entry['browser'].close()
+            except Exception:
+                pass
+            entry = await self._launch()
+        else:
+            try:
+                await entry['context'].clear_cookies()
+            except Exception:
+                pass
+        self._queue.put_nowait(entry)
+
+    async def close(self):
+        """Close every pooled browser."""
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            try:
+                await entry['browser'].close()
+            except Exception:
+                pass
+
+
+@dataclass(slots=True)
+class Comment:
+    """
+    One scraped comment row. Slots keep per-record memory roughly half of an
+    equivalent dict, which matters when a video yields thousands of rows.
+    Field order matches TikTokScraper.CSV_COLUMNS.
+    """
+    comment_id: str
+    username: str
+    comment_text: str
+    likes: int
+    timestamp: str
+    is_reply: bool
+    reply_to: str
+
 
 class TikTokScraper:
     """TikTok comment scraper using Playwright for browser automation."""
-    
+
     # CSV column order
     CSV_COLUMNS = ['comment_id', 'username', 'comment_text', 'likes', 'timestamp', 'is_reply', 'reply_to']
     
-    def __init__(self, url: str, output_file: str = "comments.csv", headless: bool = False, use_session: bool = False):
+    def __init__(self, url: str, output_file: str = "comments.csv", headless: bool = False,
+                 use_session: bool = False, output_format: str = "csv",
+                 profile_dir: Optional[str] = None):
         """
         Initialize the TikTok scraper.
-        
+
         Args:
             url: TikTok video URL
-            output_file: Output CSV filename
+            output_file: Output filename
             headless: Run browser in headless mode (default: False for CAPTCHA solving)
             use_session: Load saved browser session to avoid CAPTCHA
+            output_format: Output format, 'csv' or 'parquet'
+            profile_dir: Optional persistent Chromium profile directory; keeps
+                         cookies, IndexedDB and the HTTP cache between runs
         """
         self.url = url
         self.output_file = output_file
         self.headless = headless
         self.use_session = use_session
-        self.comments = []
+        self.output_format = output_format
+        self.profile_dir = profile_dir
+        self._api_batches = []
         self.sessions_dir = Path("sessions")
         self.session_file = self.sessions_dir / "tiktok_session.json"
         
     def validate_url(self) -> bool:
         """
         Validate if the URL is a valid TikTok video URL.
-        
+
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            parsed = urlparse(self.url)
-            # Check if it's a TikTok domain
-            if 'tiktok.com' not in parsed.netloc.lower():
-                print(f"Error: Invalid TikTok URL. Domain must be tiktok.com")
-                return False
-            
-            # Check if it contains /video/ or is a valid TikTok URL format
-            if '/video/' not in self.url and not re.search(r'/@[\w.-]+/video/\d+', self.url):
-                print(f"Error: URL doesn't appear to be a TikTok video URL")
-                return False
-                
-            return True
-        except Exception as e:
-            print(f"Error validating URL: {e}")
+        # Single anchored regex pass covers scheme, host and path shape
+        if not _TIKTOK_URL_RE.match(self.url):
+            logger.error(f"Error: URL doesn't appear to be a TikTok video URL: {self.url}")
             return False
+
+        return True
     
-    def save_session(self, context):
+    async def save_session(self, context):
         """
-        Save browser session (cookies and localStorage) to file.
-        
+        Save browser session (cookies and localStorage) to file using
+        Playwright's storage_state, which snapshots everything in one call.
+
         Args:
             context: Playwright browser context
         """
+        # Persistent profiles are written by Chromium itself; no snapshot needed
+        if self.profile_dir:
+            return
+
         try:
             self.sessions_dir.mkdir(exist_ok=True)
-            
-            # Get cookies
-            cookies = context.cookies()
-            
-            # Get localStorage from a page
-            pages = context.pages
-            local_storage = {}
-            if pages:
-                try:
-                    local_storage = pages[0].evaluate("() => Object.assign({}, window.localStorage)")
-                except Exception:
-                    pass
-            
-            session_data = {
-                'cookies': cookies,
-                'local_storage': local_storage,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
-            
-            print(f"✓ Session saved to {self.session_file}")
+            state = await context.storage_state()
+            self.session_file.write_bytes(_dump_json_bytes(state))
+            logger.info(f"✓ Session saved to {self.session_file}")
         except Exception as e:
-            print(f"Warning: Could not save session: {e}")
-    
-    def load_session(self, context):
+            logger.warning(f"Warning: Could not save session: {e}")
+
+    def session_storage_state(self) -> Optional[Dict]:
         """
-        Load browser session from file.
-        
-        Args:
-            context: Playwright browser context
-            
+        Load the saved session for browser.new_context(storage_state=...).
+
         Returns:
-            bool: True if session loaded successfully
-        """
-        try:
-            if not self.session_file.exists():
-                print(f"No saved session found at {self.session_file}")
-                return False
-            
-            with open(self.session_file, 'r') as f:
-                session_data = json.load(f)
-            
-            # Add cookies
-            if 'cookies' in session_data:
-                context.add_cookies(session_data['cookies'])
-                print(f"✓ Loaded {len(session_data['cookies'])} cookies from session")
-            
-            # Note: localStorage needs to be set on a page, we'll do this after navigation
-            self.session_local_storage = session_data.get('local_storage', {})
-            
-            # Calculate session age if timestamp available
-            if 'timestamp' in session_data:
-                try:
-                    session_age = datetime.now() - datetime.fromisoformat(session_data['timestamp'])
-                    print(f"✓ Session age: {session_age.days} days")
-                except Exception:
-                    print("✓ Session loaded (age unknown)")
-            else:
-                print("✓ Session loaded (age unknown)")
-            
-            return True
-        except Exception as e:
-            print(f"Warning: Could not load session: {e}")
-            return False
-    
-    def apply_local_storage(self, page):
-        """
-        Apply saved localStorage to a page.
-        
-        Args:
-            page: Playwright page object
+            Parsed storage state dict if the session file exists, None otherwise
         """
-        if hasattr(self, 'session_local_storage') and self.session_local_storage:
-            try:
-                for key, value in self.session_local_storage.items():
-                    page.evaluate("({key, value}) => window.localStorage.setItem(key, value)", 
-                                  {'key': key, 'value': value})
-                print(f"✓ Applied {len(self.session_local_storage)} localStorage items")
-            except Exception as e:
-                print(f"Warning: Could not apply localStorage: {e}")
-    
+        if not self.session_file.exists():
+            logger.info(f"No saved session found at {self.session_file}")
+            return None
 
-    def random_delay(self, min_seconds: float = 1.5, max_seconds: float = 4.0):
-        """
-        Add a random delay to mimic human behavior.
-        
-        Args:
-            min_seconds: Minimum delay in seconds
-            max_seconds: Maximum delay in seconds
-        """
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
-    
-    def human_like_scroll(self, page, direction: str = "down"):
-        """
-        Perform human-like scrolling with random patterns.
-        
-        Args:
-            page: Playwright page object
-            direction: "down" or "up"
-        """
+        # Report session age based on when the file was last written
         try:
-            # Random scroll distance
-            if direction == "down":
-                scroll_amount = random.randint(300, 800)
-                page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            else:
-                scroll_amount = random.randint(300, 800)
-                page.evaluate(f"window.scrollBy(0, -{scroll_amount})")
-            
-            # Random delay after scroll
-            self.random_delay(0.5, 1.5)
-        except Exception as e:
-            print(f"Warning: Error during human-like scroll: {e}")
-    
-    def move_mouse_randomly(self, page):
-        """
-        Move mouse to random position to mimic human behavior.
-        
-        Args:
-            page: Playwright page object
-        """
+            session_age = datetime.now() - datetime.fromtimestamp(self.session_file.stat().st_mtime)
+            logger.debug(f"✓ Session age: {session_age.days} days")
+        except Exception:
+            logger.debug("✓ Session loaded (age unknown)")
+
         try:
-            # Get viewport size
-            viewport = page.viewport_size
-            if viewport:
-                x = random.randint(100, viewport['width'] - 100)
-                y = random.randint(100, viewport['height'] - 100)
-                page.mouse.move(x, y)
+            return _load_json_bytes(self.session_file.read_bytes())
         except Exception as e:
-            print(f"Warning: Error moving mouse: {e}")
-    
-    def click_comments_button(self, page) -> bool:
+            logger.warning(f"Warning: Could not load session: {e}")
+            return None
+
+    async def click_comments_button(self, page) -> bool:
         """
         Click the Comments tab button to load the comments section.
         Tries multiple selectors as fallback in case TikTok changes class names.
@@ -227,7 +667,7 @@ class TikTokScraper:
         Returns:
             bool: True if button was clicked successfully, False otherwise
         """
-        print("Clicking Comments tab...")
+        logger.debug("Clicking Comments tab...")
         
         # Multiple selectors to try (in order of preference)
         selectors = [
@@ -240,20 +680,61 @@ class TikTokScraper:
         for selector in selectors:
             try:
                 # Try to find and click the button with this selector
-                button = page.wait_for_selector(selector, timeout=5000, state='visible')
-                button.click()
-                print("✓ Comments tab clicked")
+                button = await page.wait_for_selector(selector, timeout=5000, state='visible')
+                await button.click()
+                logger.info("✓ Comments tab clicked")
                 return True
             except PlaywrightTimeoutError:
                 continue
             except Exception as e:
-                print(f"Note: Selector '{selector}' failed: {e}")
+                logger.debug(f"Note: Selector '{selector}' failed: {e}")
                 continue
         
-        print("⚠️ Could not find Comments button, trying to proceed anyway...")
+        logger.warning("⚠️ Could not find Comments button, trying to proceed anyway...")
         return False
     
-    def wait_for_comments_section(self, page) -> bool:
+    async def _has_captcha_selector(self, page) -> bool:
+        """
+        Cheap CAPTCHA probe: one count() on the pre-joined overlay selector
+        instead of a locator round-trip per candidate.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            True if a CAPTCHA overlay element is present
+        """
+        try:
+            return await page.locator(_CAPTCHA_SEL).count() > 0
+        except Exception:
+            return False
+
+    async def _has_captcha_text(self, page) -> bool:
+        """
+        Slow CAPTCHA probe: scan the visible page text for overlay keywords.
+        The scan runs inside the page and returns only the hit count, so the
+        CDP transfer is a single integer instead of the page text. Called
+        once per scrape as a backup when the selector probe comes up empty.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            True if two or more CAPTCHA keywords appear in the visible text
+        """
+        try:
+            hits = await page.evaluate(
+                """(kws) => {
+                    const t = document.body.innerText.toLowerCase();
+                    return kws.reduce((n, k) => n + (t.includes(k) ? 1 : 0), 0);
+                }""",
+                sorted(_CAPTCHA_KEYWORDS)
+            )
+        except Exception:
+            return False
+        return hits >= 2
+
+    async def wait_for_comments_section(self, page) -> bool:
         """
         Wait for the comments section to load after clicking the Comments button.
         IMPORTANT: The container exists immediately but content changes from videos to comments.
@@ -264,642 +745,1064 @@ class TikTokScraper:
         Returns:
             bool: True if comments section loaded, False otherwise
         """
-        print("Waiting for comments to load...")
+        logger.debug("Waiting for comments to load...")
         
         # Step 1: Wait for the tab content container to be visible
         try:
-            page.wait_for_selector('.TUXTabBar-content', state='visible', timeout=10000)
-            print("✓ Comments container found")
+            await page.wait_for_selector('.TUXTabBar-content', state='visible', timeout=10000)
+            logger.info("✓ Comments container found")
         except PlaywrightTimeoutError:
-            print("❌ Could not find comments container (.TUXTabBar-content)")
+            logger.error("❌ Could not find comments container (.TUXTabBar-content)")
             return False
         except Exception as e:
-            print(f"❌ Error waiting for comments container: {e}")
+            logger.error(f"❌ Error waiting for comments container: {e}")
             return False
         
-        # Step 2: CRITICAL - Wait for content transformation
-        # The container exists immediately but content takes time to change from videos to comments
-        # This is necessary because TikTok dynamically swaps content in the same container
-        print("Waiting for content transformation (videos → comments)...")
-        time.sleep(3)  # Required: Give time for content to swap (based on TikTok's behavior)
-        
+        # Step 2: Wait for content transformation (videos → comments)
+        # The container exists immediately but content takes time to change;
+        # polling for the first comment wrapper returns the instant it lands
+        # instead of paying a fixed sleep
+        logger.debug("Waiting for content transformation (videos → comments)...")
+        try:
+            await page.wait_for_function(
+                "() => document.querySelector('.css-1mzopna-7937d88b--DivCommentObjectWrapper')"
+                " || document.querySelector('[data-e2e=\"comment-item\"]')",
+                timeout=10000
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("Note: No comment wrapper appeared within 10s, checking fallback selectors...")
+        except Exception as e:
+            logger.warning(f"Note: Error while waiting for content transformation: {e}")
+
         # Step 3: Wait for actual comment elements to appear
-        print("Waiting for comment items to appear...")
-        comment_selectors = [
-            '.TUXTabBar-content [data-e2e="comment-item"]',
-            '.TUXTabBar-content div[class*="CommentItem"]',
-            '.TUXTabBar-content div[class*="comment-item"]',
+        # Short timeouts here — the function-wait above already confirmed
+        # (or gave up on) DOM readiness
+        logger.debug("Waiting for comment items to appear...")
+        # One comma-joined selector covers every fallback, so the worst case
+        # is a single timed-out wait rather than one 2s wait per candidate
+        comment_selector = (
+            '.TUXTabBar-content [data-e2e="comment-item"], '
+            '.TUXTabBar-content div[class*="CommentItem"], '
+            '.TUXTabBar-content div[class*="comment-item"], '
             '.TUXTabBar-content div[class*="comment"]'
-        ]
-        
-        for selector in comment_selectors:
-            try:
-                page.wait_for_selector(selector, timeout=10000, state='visible')
-                # Count how many we found
-                count = page.locator(selector).count()
-                print(f"✓ Found {count} comments using selector: {selector}")
-                return True
-            except PlaywrightTimeoutError:
-                print(f"Note: Selector '{selector}' timed out")
-                continue
-            except Exception as e:
-                print(f"Note: Selector '{selector}' failed: {e}")
-                continue
-        
-        print("⚠️ Could not find comment elements in container")
-        print("⚠️ The container may be empty or selectors may need updating")
+        )
+
+        try:
+            await page.wait_for_selector(comment_selector, timeout=5000, state='visible')
+            # Count how many we found
+            count = await page.locator(comment_selector).count()
+            logger.info(f"✓ Found {count} comments in container")
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug("Note: No comment elements appeared within 5s")
+        except Exception as e:
+            logger.warning(f"Note: Error waiting for comment elements: {e}")
+
+        logger.warning("⚠️ Could not find comment elements in container")
+        logger.warning("⚠️ The container may be empty or selectors may need updating")
         return False
     
-    def scroll_to_load_comments(self, page, max_scrolls: int = 20, max_retries: int = 3):
-        """
-        Scroll within the comments container to load more comments.
-        Uses correct selector for top-level comments with fallback options.
-        
-        Args:
-            page: Playwright page object
-            max_scrolls: Maximum number of scroll attempts
-            max_retries: Maximum number of retries when no new comments load
-        """
-        print("Scrolling to load all comments...")
-        last_count = 0
-        no_change_count = 0
-        
-        # Multiple selectors for top-level comments (from most specific to fallbacks)
-        comment_selectors = [
-            '.css-1mzopna-7937d88b--DivCommentObjectWrapper',  # Primary selector
-            'div[class*="DivCommentObjectWrapper"]',  # Fallback without hash
-            '[data-e2e="comment-item"]'  # Generic fallback
-        ]
-        
-        # Find working selector
-        active_selector = None
-        for selector in comment_selectors:
-            try:
-                count = page.locator(selector).count()
-                if count > 0:
-                    active_selector = selector
-                    print(f"Using selector: {selector}")
-                    break
-            except Exception:
-                continue
-        
-        if not active_selector:
-            print("⚠️ No comment selector found, using default")
-            active_selector = comment_selectors[0]
-        
-        for i in range(max_scrolls):
-            # Count current top-level comments
-            try:
-                current_comments = page.locator(active_selector).count()
-            except Exception as e:
-                print(f"Warning: Error counting comments: {e}")
-                current_comments = last_count
-            
-            # Scroll WITHIN the comments container using scrollBy for incremental scrolling
-            try:
-                page.evaluate('''
-                    () => {
-                        const container = document.querySelector('.TUXTabBar-content');
-                        if (container) {
-                            container.scrollBy(0, 1000);
-                        }
-                    }
-                ''')
-            except Exception as e:
-                print(f"Warning: Error scrolling container: {e}")
-            
-            # Wait for new comments to load
-            self.random_delay(2, 3)
-            
-            # Check if new comments loaded
-            if current_comments > last_count:
-                print(f"  Loaded {current_comments} comments...")
-                last_count = current_comments
-                no_change_count = 0  # Reset retry counter
-            else:
-                no_change_count += 1
-                print(f"  No new comments (attempt {no_change_count}/{max_retries})")
-                
-                if no_change_count >= max_retries:
-                    print(f"✓ Finished scrolling. Total top-level comments: {last_count}")
-                    break
-        
-        return last_count
-    
-    def handle_replies(self, page, parent_comment_elem, comments_data, parent_username, parent_index):
+    async def expand_replies(self, page) -> int:
         """
-        Click 'View replies' button and extract nested comments.
-        
+        Click every 'View replies' button in a single in-page pass.
+
         Args:
             page: Playwright page object
-            parent_comment_elem: Parent comment element
-            comments_data: List to append reply comments to
-            parent_username: Username of parent commenter
-            parent_index: Index of parent comment
+
+        Returns:
+            Number of reply buttons clicked
         """
         try:
-            # Look for "View replies" button with multiple selectors
-            reply_button_selectors = [
-                'button.TUXButton:has-text("View")',
-                'button:has-text("replies")',
-                'button.TUXButton--borderless:has-text("View")',
-                'button:has-text("View")'
-            ]
-            
-            reply_button = None
-            for selector in reply_button_selectors:
+            clicked = await page.evaluate(_EXPAND_REPLIES_JS)
+            if clicked:
+                logger.info(f"  → Expanded replies on {clicked} comments")
+                # Wait for reply elements to appear in DOM
                 try:
-                    reply_button = parent_comment_elem.query_selector(selector)
-                    if reply_button:
-                        break
+                    await page.wait_for_selector('.css-7waxo-7937d88b--DivCommentItemWrapper, div[class*="DivCommentItemWrapper"]',
+                                                 timeout=3000, state='visible')
                 except Exception:
-                    continue
-            
-            if reply_button:
-                # Get reply count from button text
-                try:
-                    button_text = reply_button.inner_text(timeout=1000)
-                    print(f"    → Clicking: {button_text}")
-                    
-                    # Click to expand replies
-                    reply_button.click()
-                    
-                    # Wait for replies to actually load (better than time.sleep)
-                    try:
-                        # Wait for reply elements to appear in DOM
-                        page.wait_for_selector('.css-7waxo-7937d88b--DivCommentItemWrapper, div[class*="DivCommentItemWrapper"]', 
-                                              timeout=3000, state='visible')
-                    except Exception:
-                        # Fallback to short wait if selector fails
-                        time.sleep(1.5)
-                    
-                    # Now extract the reply comments using correct class selector with fallback
-                    # Replies use: css-7waxo-7937d88b--DivCommentItemWrapper
-                    reply_selectors = [
-                        '.css-7waxo-7937d88b--DivCommentItemWrapper',
-                        'div[class*="DivCommentItemWrapper"]'
-                    ]
-                    
-                    reply_elements = []
-                    for selector in reply_selectors:
-                        try:
-                            reply_elements = parent_comment_elem.query_selector_all(selector)
-                            if reply_elements:
-                                break
-                        except Exception:
-                            continue
-                    
-                    print(f"    ✓ Found {len(reply_elements)} replies")
-                    
-                    for j, reply_elem in enumerate(reply_elements):
-                        try:
-                            # Extract reply username
-                            reply_username = "Unknown"
-                            username_selectors = [
-                                'p.TUXText--weight-medium[style*="font-size: 14px"]',
-                                'p.css-u0d6t3-7937d88b--StyledTUXText',
-                                'p.TUXText.TUXText--weight-medium'
-                            ]
-                            for selector in username_selectors:
-                                try:
-                                    username_elem = reply_elem.query_selector(selector)
-                                    if username_elem:
-                                        reply_username = username_elem.inner_text(timeout=1000)
-                                        break
-                                except Exception:
-                                    continue
-                            
-                            # Extract reply text
-                            reply_text = ""
-                            text_selectors = [
-                                'span[data-e2e="comment-text"]',
-                                'p[data-e2e="comment-text"]',
-                                'span.TUXText:not([style*="color: var(--ui-text-3)"])'
-                            ]
-                            for selector in text_selectors:
-                                try:
-                                    text_elem = reply_elem.query_selector(selector)
-                                    if text_elem:
-                                        reply_text = text_elem.inner_text(timeout=1000)
-                                        break
-                                except Exception:
-                                    continue
-                            
-                            # Extract reply likes
-                            reply_likes = 0
-                            likes_selectors = [
-                                'span.TUXText--weight-normal[style*="color: var(--ui-text-3)"]',
-                                'span.TUXText[style*="color: var(--ui-text-3)"][style*="font-size: 14px"]'
-                            ]
-                            for selector in likes_selectors:
-                                try:
-                                    likes_elem = reply_elem.query_selector(selector)
-                                    if likes_elem:
-                                        likes_text = likes_elem.inner_text(timeout=1000)
-                                        # Check if it's actually a number (not "Reply" or other text)
-                                        if self.is_numeric_likes(likes_text):
-                                            reply_likes = self.parse_number(likes_text)
-                                            break
-                                except Exception:
-                                    continue
-                            
-                            reply_data = {
-                                'username': reply_username.strip(),
-                                'comment_text': reply_text.strip(),
-                                'likes': reply_likes,
-                                'timestamp': '',  # Keep consistent with top-level structure
-                                'is_reply': True,
-                                'reply_to': parent_username,
-                                'comment_id': f'comment_{parent_index}_reply_{j}'
-                            }
-                            
-                            comments_data.append(reply_data)
-                            print(f"      ↳ {reply_username}: {reply_text[:40] if reply_text else ''}... (Likes: {reply_likes})")
-                            
-                        except Exception as e:
-                            print(f"⚠️ Error extracting reply {j}: {e}")
-                            continue
-                except Exception as e:
-                    print(f"⚠️ Error clicking reply button: {e}")
-                    
+                    # Fallback to short wait if selector fails
+                    await asyncio.sleep(1.5)
+            return clicked
         except Exception as e:
-            print(f"⚠️ Error handling replies: {e}")
-    
-    def extract_comments(self, page) -> List[Dict]:
+            logger.warning(f"⚠️ Error expanding replies: {e}")
+            return 0
+
+    def _parse_comments_html(self, html: str) -> List[Dict]:
         """
-        Extract comments using correct CSS selectors for TikTok's structure.
-        
+        Parse a full-page HTML snapshot into raw comment records with lxml.
+        Produces the same record shape as the in-page JS extractor.
+
+        Args:
+            html: HTML containing comment wrapper elements
+
+        Returns:
+            List of raw comment dicts with nested replies
+        """
+        def first_text(nodes) -> str:
+            return nodes[0].text_content().strip() if nodes else ''
+
+        def likes_of(node) -> str:
+            # Only accept candidates that actually look like a number
+            for candidate in _XPATH_LIKES(node):
+                value = candidate.text_content().strip()
+                if _LIKES_RE.match(value):
+                    return value
+            return ''
+
+        tree = lxml_html.fromstring(html.encode('utf-8'), parser=_LXML_PARSER)
+        comments = []
+        for node in _XPATH_TOP(tree):
+            time_nodes = _XPATH_TIME(node)
+            if time_nodes:
+                timestamp = time_nodes[0].get('datetime') or time_nodes[0].text_content().strip()
+            else:
+                match = _TIME_RE.search(node.text_content())
+                timestamp = match.group(0) if match else ''
+
+            comments.append({
+                'username': first_text(_XPATH_USER(node)) or 'Unknown',
+                'comment_text': first_text(_XPATH_TEXT(node)),
+                'likes': likes_of(node),
+                'timestamp': timestamp,
+                'replies': [
+                    {
+                        'username': first_text(_XPATH_USER(reply)) or 'Unknown',
+                        'comment_text': first_text(_XPATH_TEXT(reply)),
+                        'likes': likes_of(reply)
+                    }
+                    for reply in _XPATH_REPLIES(node)
+                ]
+            })
+        return comments
+
+    async def _harvest_comments(self, page, start: int = 0) -> List[Dict]:
+        """
+        Harvest raw comment records from the page, skipping the first
+        ``start`` wrappers already seen on earlier ticks.
+        Prefers serializing just the new wrappers' HTML for in-process lxml
+        parsing (C-backed libxml2); falls back to the in-page JS extractor
+        when lxml is missing or the snapshot yields nothing.
+
         Args:
             page: Playwright page object
-            
+            start: Number of leading comment wrappers to skip
+
         Returns:
-            List of comment dictionaries
+            List of raw comment dicts with nested replies
         """
-        comments_data = []
-        print("\nExtracting comments...")
-        
+        if _HAVE_LXML:
+            try:
+                fragments = await page.evaluate(_WRAPPER_HTML_JS, start)
+                if not fragments:
+                    return []
+                parsed = self._parse_comments_html('<div>' + ''.join(fragments) + '</div>')
+                if parsed:
+                    return parsed
+            except Exception as e:
+                logger.debug(f"Note: lxml parse failed, falling back to in-page extractor: {e}")
+        return await page.evaluate(_EXTRACT_COMMENTS_JS, start)
+
+    def _materialize_comment(self, raw: Dict, index: int) -> List[Comment]:
+        """
+        Turn one raw in-page comment record into CSV-ready Comment records.
+
+        Args:
+            raw: Record returned by the in-page extractor
+            index: Top-level index of the comment (drives comment_id)
+
+        Returns:
+            List with the top-level comment followed by its replies
+        """
+        # Normalize each field exactly once; every later use is plain access
+        username = (raw.get('username') or 'Unknown').strip() or 'Unknown'
+        comment_text = (raw.get('comment_text') or '').strip()
+
+        # Likes are pre-validated in the page, so just parse
+        likes = self.parse_number(raw.get('likes', ''))
+
+        rows = [Comment(
+            comment_id=f'comment_{index}',
+            username=username,
+            comment_text=comment_text,
+            likes=likes,
+            timestamp=(raw.get('timestamp') or '').strip(),
+            is_reply=False,
+            reply_to='',
+        )]
+        logger.debug(f"  [{index+1}] {username}: {comment_text[:50] if comment_text else ''}... (Likes: {likes})")
+
+        for j, reply in enumerate(raw.get('replies', [])):
+            reply_username = (reply.get('username') or 'Unknown').strip() or 'Unknown'
+            reply_text = (reply.get('comment_text') or '').strip()
+            reply_likes = self.parse_number(reply.get('likes', ''))
+
+            rows.append(Comment(
+                comment_id=f'comment_{index}_reply_{j}',
+                username=reply_username,
+                comment_text=reply_text,
+                likes=reply_likes,
+                timestamp='',  # Keep consistent with top-level structure
+                is_reply=True,
+                reply_to=username,
+            ))
+            logger.debug(f"      ↳ {reply_username}: {reply_text[:40] if reply_text else ''}... (Likes: {reply_likes})")
+
+        return rows
+
+    async def _maybe_capture_comments(self, response):
+        """
+        Response listener: stash parsed comment-list API payloads.
+        Registered on the page before navigation so every comment batch the
+        page fetches is captured passively, with no extra requests.
+
+        Args:
+            response: Playwright response object
+        """
+        if _COMMENT_API_SNIPPET not in response.url or response.status != 200:
+            return
+        try:
+            # Parse the raw body with orjson when available — batches run to
+            # hundreds of KB and response.json() always goes through stdlib
+            payload = _load_json_bytes(await response.body())
+        except Exception as e:
+            logger.debug(f"Note: Could not parse comment API response: {e}")
+            return
+        if isinstance(payload, dict) and payload.get('comments'):
+            logger.debug(f"  Captured comment batch ({len(payload['comments'])} comments, "
+                         f"{response.headers.get('content-encoding', 'identity')} encoded)")
+            self._api_batches.append(payload)
+
+    def _rows_from_api_batch(self, payload: Dict, start_index: int) -> List[Comment]:
+        """
+        Turn one comment-list API payload into CSV-ready dicts.
+        Produces the same row shape as the DOM path, but with exact like
+        counts and real timestamps instead of rendered approximations.
+
+        Args:
+            payload: Parsed JSON from a /api/comment/list response
+            start_index: Top-level index of the first comment in the batch
+
+        Returns:
+            List of Comment records, replies following their parents
+        """
+        rows = []
+        for i, item in enumerate(payload.get('comments') or [], start=start_index):
+            user = item.get('user') or {}
+            username = (user.get('nickname') or user.get('unique_id') or 'Unknown').strip()
+            comment_id = str(item.get('cid') or f'comment_{i}')
+            created = item.get('create_time')
+            try:
+                timestamp = datetime.fromtimestamp(int(created)).strftime('%Y-%m-%d %H:%M') if created else ''
+            except (ValueError, OSError, OverflowError):
+                timestamp = ''
+
+            rows.append(Comment(
+                comment_id=comment_id,
+                username=username,
+                comment_text=(item.get('text') or '').strip(),
+                likes=int(item.get('digg_count') or 0),
+                timestamp=timestamp,
+                is_reply=False,
+                reply_to='',
+            ))
+
+            for j, reply in enumerate(item.get('reply_comment') or []):
+                reply_user = reply.get('user') or {}
+                rows.append(Comment(
+                    comment_id=f'{comment_id}_reply_{j}',
+                    username=(reply_user.get('nickname') or reply_user.get('unique_id') or 'Unknown').strip(),
+                    comment_text=(reply.get('text') or '').strip(),
+                    likes=int(reply.get('digg_count') or 0),
+                    timestamp='',  # Keep consistent with top-level structure
+                    is_reply=True,
+                    reply_to=username,
+                ))
+        return rows
+
+    async def iter_api_comments(self, page, max_scrolls: int = 20, max_retries: int = 3):
+        """
+        Yield Comment records from captured API payloads as scrolling proceeds.
+        Scroll ticks only exist to trigger the next comment-list request; no
+        DOM extraction or reply expansion happens on this path.
+
+        Args:
+            page: Playwright page object
+            max_scrolls: Maximum number of scroll attempts
+            max_retries: Maximum number of ticks with no new API batches
+
+        Yields:
+            Comment records (top-level comments followed by their replies)
+        """
+        logger.debug("Extracting comments from captured API responses...")
+
+        drained = 0
+        top_level = 0
+        no_change_count = 0
+
+        # One extra pass so batches landed by the last scroll are drained
+        for _ in range(max_scrolls + 1):
+            new_batches = self._api_batches[drained:]
+            drained = len(self._api_batches)
+
+            new_top_level = 0
+            for payload in new_batches:
+                for row in self._rows_from_api_batch(payload, top_level + new_top_level):
+                    yield row
+                new_top_level += len(payload.get('comments') or [])
+
+            if new_top_level:
+                top_level += new_top_level
+                no_change_count = 0
+                logger.debug(f"  Captured {top_level} comments from API...")
+            else:
+                no_change_count += 1
+                if no_change_count >= max_retries:
+                    break
+
+            # Nudge the page so it fetches the next comment batch
+            try:
+                await page.evaluate(_SCROLL_TICK_JS)
+            except Exception as e:
+                logger.warning(f"Warning: Error scrolling container: {e}")
+
+        logger.info(f"✓ Finished API capture. Total top-level comments: {top_level}")
+
+    async def iter_comments(self, page, max_scrolls: int = 20, max_retries: int = 3):
+        """
+        Yield Comment records as the scroll progresses.
+        Each tick scrolls one step in-page, harvests with the batch extractor,
+        and yields only the comments not seen on previous ticks — so callers
+        can stream rows to disk with constant memory.
+
+        Args:
+            page: Playwright page object
+            max_scrolls: Maximum number of scroll attempts
+            max_retries: Maximum number of retries when no new comments load
+
+        Yields:
+            Comment records (top-level comments followed by their replies)
+        """
+        logger.debug("Extracting comments...")
+
+        # Wait for comments container
         try:
-            # Wait for comments container
+            await page.wait_for_selector('.TUXTabBar-content', timeout=10000)
+            logger.info("✓ Comments container found")
+        except Exception as e:
+            logger.error(f"❌ Could not find comments container: {e}")
+            return
+
+        seen_top_level = 0
+        no_change_count = 0
+        clicked = 0
+
+        # One extra pass so comments loaded by the last scroll are harvested
+        for _ in range(max_scrolls + 1):
             try:
-                page.wait_for_selector('.TUXTabBar-content', timeout=10000)
-                print("✓ Comments container found")
+                clicked = await self.expand_replies(page)
+                # Each comment is yielded exactly once, so a comment whose
+                # replies were expanded this tick must not be materialized
+                # until the replies have had a tick to render — skip the
+                # harvest entirely and pick those comments up next pass
+                new_raws = [] if clicked else await self._harvest_comments(page, seen_top_level)
             except Exception as e:
-                print(f"❌ Could not find comments container: {e}")
-                return []
-            
-            # Get all TOP-LEVEL comment wrappers using correct selector with fallback
-            comment_selectors = [
-                '.css-1mzopna-7937d88b--DivCommentObjectWrapper',  # Primary selector
-                'div[class*="DivCommentObjectWrapper"]',  # Fallback without hash
-                '[data-e2e="comment-item"]'  # Generic fallback
-            ]
-            
-            top_level_comments = []
-            active_selector = None
-            for selector in comment_selectors:
+                logger.warning(f"⚠️ Error extracting comment batch: {e}")
+                clicked = 0
+                new_raws = []
+
+            for i, raw in enumerate(new_raws, start=seen_top_level):
                 try:
-                    top_level_comments = page.query_selector_all(selector)
-                    if top_level_comments:
-                        active_selector = selector
-                        break
-                except Exception:
+                    for row in self._materialize_comment(raw, i):
+                        yield row
+                except Exception as e:
+                    logger.warning(f"⚠️ Error extracting comment {i}: {e}")
                     continue
-            
-            print(f"✓ Found {len(top_level_comments)} top-level comments (using: {active_selector})")
-            
-            for i, comment_elem in enumerate(top_level_comments):
+
+            if new_raws or clicked:
+                if new_raws:
+                    seen_top_level += len(new_raws)
+                    logger.debug(f"  Loaded {seen_top_level} comments...")
+                no_change_count = 0
+            else:
+                no_change_count += 1
+                if no_change_count >= max_retries:
+                    break
+
+            # Scroll one step and let new comments land before the next harvest
+            try:
+                await page.evaluate(_SCROLL_TICK_JS)
+            except Exception as e:
+                logger.warning(f"Warning: Error scrolling container: {e}")
+
+        # Drain pass: if the scroll budget ran out right after an expansion
+        # tick, the held-back comments still need to be materialized
+        if clicked:
+            try:
+                new_raws = await self._harvest_comments(page, seen_top_level)
+            except Exception as e:
+                logger.warning(f"⚠️ Error extracting final comment batch: {e}")
+                new_raws = []
+            for i, raw in enumerate(new_raws, start=seen_top_level):
                 try:
-                    # Extract username - more flexible selector
-                    username = None
-                    username_selectors = [
-                        'p.TUXText--weight-medium[style*="font-size: 14px"]',
-                        'p.css-u0d6t3-7937d88b--StyledTUXText',
-                        'p.TUXText.TUXText--weight-medium'
-                    ]
-                    for selector in username_selectors:
-                        try:
-                            username_elem = comment_elem.query_selector(selector)
-                            if username_elem:
-                                username = username_elem.inner_text(timeout=1000)
-                                break
-                        except Exception:
-                            continue
-                    
-                    if not username:
-                        username = "Unknown"
-                    
-                    # Extract comment text
-                    comment_text = ""
-                    text_selectors = [
-                        'span[data-e2e="comment-text"]',
-                        'p[data-e2e="comment-text"]',
-                        'span.TUXText:not([style*="color: var(--ui-text-3)"])',  # Avoid like count
-                    ]
-                    for selector in text_selectors:
-                        try:
-                            text_elem = comment_elem.query_selector(selector)
-                            if text_elem:
-                                comment_text = text_elem.inner_text(timeout=1000)
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Extract likes - specific selector for gray text with numbers
-                    likes = 0
-                    likes_selectors = [
-                        'span.TUXText--weight-normal[style*="color: var(--ui-text-3)"]',
-                        'span.TUXText[style*="color: var(--ui-text-3)"][style*="font-size: 14px"]',
-                    ]
-                    for selector in likes_selectors:
-                        try:
-                            likes_elem = comment_elem.query_selector(selector)
-                            if likes_elem:
-                                likes_text = likes_elem.inner_text(timeout=1000)
-                                # Check if it's actually a number (not "Reply" or other text)
-                                if self.is_numeric_likes(likes_text):
-                                    likes = self.parse_number(likes_text)
-                                    break
-                        except Exception:
-                            continue
-                    
-                    # Extract timestamp (keeping existing logic)
-                    timestamp = ""
-                    try:
-                        time_elem = comment_elem.query_selector('time, [datetime]')
-                        if time_elem:
-                            timestamp = time_elem.get_attribute('datetime', timeout=1000) or ""
-                            if not timestamp:
-                                timestamp = time_elem.inner_text(timeout=1000)
-                    except Exception:
-                        try:
-                            # Look for relative time text like "1d ago", "2h ago"
-                            text_content = comment_elem.inner_text(timeout=1000)
-                            time_pattern = r'\d+[smhd]\s*ago|\d+-\d+-\d+'
-                            match = re.search(time_pattern, text_content)
-                            timestamp = match.group(0) if match else ""
-                        except Exception:
-                            timestamp = ""
-                    
-                    comment_data = {
-                        'username': username.strip(),
-                        'comment_text': comment_text.strip(),
-                        'likes': likes,
-                        'timestamp': timestamp.strip(),
-                        'is_reply': False,
-                        'reply_to': '',
-                        'comment_id': f'comment_{i}'
-                    }
-                    
-                    comments_data.append(comment_data)
-                    print(f"  [{i+1}] {username}: {comment_text[:50] if comment_text else ''}... (Likes: {likes})")
-                    
-                    # Check for "View replies" button and click it
-                    self.handle_replies(page, comment_elem, comments_data, username, i)
-                    
+                    for row in self._materialize_comment(raw, i):
+                        yield row
                 except Exception as e:
-                    print(f"⚠️ Error extracting comment {i}: {e}")
+                    logger.warning(f"⚠️ Error extracting comment {i}: {e}")
                     continue
-            
-            print(f"\n✓ Extracted {len([c for c in comments_data if not c['is_reply']])} top-level comments and {len([c for c in comments_data if c['is_reply']])} replies")
-            
-        except Exception as e:
-            print(f"Error extracting comments: {e}")
-        
-        return comments_data
+            seen_top_level += len(new_raws)
+
+        logger.info(f"✓ Finished scrolling. Total top-level comments: {seen_top_level}")
+
+    def _iter_rows(self, page):
+        """
+        Pick the comment source: captured API payloads when any arrived
+        (structured JSON, no DOM work), the DOM extractor otherwise.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Async generator of Comment records
+        """
+        if self._api_batches:
+            logger.info("✓ Comment API responses captured — skipping DOM extraction")
+            return self.iter_api_comments(page)
+        return self.iter_comments(page)
+
+    async def extract_comments(self, page) -> List[Comment]:
+        """
+        Extract all comments into a list (non-streaming convenience path).
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            List of Comment records
+        """
+        return [row async for row in self._iter_rows(page)]
+
+    async def _collect_comments(self, page) -> int:
+        """
+        Stream comments from the page into the output file.
+        CSV rows hit the disk as each scroll tick yields them, so memory stays
+        flat and already-written rows survive a crash. Parquet needs the whole
+        table up front, so that path buffers rows and writes at the end.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Number of comments saved
+        """
+        if self.output_format == 'parquet':
+            comments = await self.extract_comments(page)
+            if comments:
+                # Write off the event loop so concurrent scrapers keep going
+                await asyncio.to_thread(self.save_to_parquet, comments)
+            return len(comments)
+
+        count = 0
+        reply_count = 0
+        pending = []
+        # Positional csv.writer with a 1 MiB buffer: rows become lists once
+        # and land on disk in writerows batches instead of one write per row
+        with open(self.output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(self.CSV_COLUMNS)
+            async for row in self._iter_rows(page):
+                pending.append(self._row_values(row))
+                count += 1
+                if row.is_reply:
+                    reply_count += 1
+                if len(pending) >= 500:
+                    writer.writerows(pending)
+                    pending.clear()
+                    f.flush()
+            if pending:
+                writer.writerows(pending)
+
+        if count:
+            logger.info(f"✅ Scraping complete! Saved to {self.output_file}")
+            logger.info(f"   Total comments: {count} ({count - reply_count} top-level, {reply_count} replies)")
+        return count
     
     def parse_number(self, text: str) -> int:
         """
         Parse number text that might include K, M suffixes.
-        
+
         Args:
             text: Number string like "1.2K" or "5M"
-            
+
         Returns:
             Parsed integer value
         """
-        if not text:
-            return 0
-        
-        text = text.strip().upper()
-        multiplier = 1
-        
-        if 'K' in text:
-            multiplier = 1000
-            text = text.replace('K', '')
-        elif 'M' in text:
-            multiplier = 1000000
-            text = text.replace('M', '')
-        elif 'B' in text:
-            multiplier = 1000000000
-            text = text.replace('B', '')
-        
-        try:
-            number = float(text)
-            return int(number * multiplier)
-        except (ValueError, TypeError):
-            return 0
+        # Strip before hitting the cache so whitespace variants collapse
+        return _parse_number((text or '').strip())
     
-    def is_numeric_likes(self, text: str) -> bool:
+    def _normalize_row(self, comment: Comment) -> Dict:
         """
-        Validate if text is numeric (for likes count validation).
-        
+        Render a Comment record as a dict keyed by CSV column.
+
         Args:
-            text: Text to validate
-            
+            comment: Comment record
+
         Returns:
-            True if text represents a number, False otherwise
+            Dict with every CSV column present
         """
-        if not text:
-            return False
-        cleaned = text.strip().replace('K', '').replace('M', '').replace('.', '').replace(',', '')
-        return cleaned.isdigit()
-    
-    def save_to_csv(self, comments: List[Dict]):
+        return asdict(comment)
+
+    def _row_values(self, comment: Comment) -> List:
         """
-        Save comments to CSV file.
-        
+        Flatten a Comment record into CSV column order for csv.writer.
+
+        Args:
+            comment: Comment record
+
+        Returns:
+            List of values in CSV_COLUMNS order
+        """
+        return [comment.comment_id, comment.username, comment.comment_text,
+                comment.likes, comment.timestamp, comment.is_reply, comment.reply_to]
+
+    def save_to_csv(self, comments: List[Comment]):
+        """
+        Save comments to CSV file with the stdlib csv module.
+        Rows go out through writerows in 10k chunks on a 1 MiB-buffered file,
+        so a 100k-comment dump costs a handful of write syscalls.
+
         Args:
-            comments: List of comment dictionaries
+            comments: List of Comment records
         """
         if not comments:
-            print("No comments to save.")
+            logger.info("No comments to save.")
             return
-        
+
         try:
-            df = pd.DataFrame(comments)
-            # Ensure all columns exist
-            for col in self.CSV_COLUMNS:
-                if col not in df.columns:
-                    df[col] = '' if col != 'likes' else 0
-            df = df[self.CSV_COLUMNS]
-            
-            df.to_csv(self.output_file, index=False, encoding='utf-8', quoting=csv.QUOTE_ALL)
-            
-            # Calculate stats
-            top_level_count = len([c for c in comments if not c.get('is_reply', False)])
-            reply_count = len([c for c in comments if c.get('is_reply', False)])
-            
-            print(f"\n✅ Scraping complete! Saved to {self.output_file}")
-            print(f"   Total comments: {len(comments)} ({top_level_count} top-level, {reply_count} replies)")
+            with open(self.output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                writer.writerow(self.CSV_COLUMNS)
+                for start in range(0, len(comments), 10000):
+                    writer.writerows(self._row_values(c) for c in comments[start:start + 10000])
+
+            # Calculate stats in one pass
+            reply_count = sum(1 for c in comments if c.is_reply)
+            top_level_count = len(comments) - reply_count
+
+            logger.info(f"✅ Scraping complete! Saved to {self.output_file}")
+            logger.info(f"   Total comments: {len(comments)} ({top_level_count} top-level, {reply_count} replies)")
         except Exception as e:
-            print(f"Error saving to CSV: {e}")
-            # Fallback to basic CSV writing
-            try:
-                with open(self.output_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.CSV_COLUMNS)
-                    writer.writeheader()
-                    writer.writerows(comments)
-                print(f"✓ Saved using fallback method to {self.output_file}")
-            except Exception as e2:
-                print(f"Error with fallback save: {e2}")
+            logger.error(f"Error saving to CSV: {e}")
+
+    def save_to_parquet(self, comments: List[Comment]):
+        """
+        Save comments to a Parquet file (requires pyarrow).
+
+        Args:
+            comments: List of Comment records
+        """
+        if not comments:
+            logger.info("No comments to save.")
+            return
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("Error: Parquet output requires pyarrow. Install it with: pip install pyarrow")
+            return
+
+        try:
+            table = pa.Table.from_pylist([self._normalize_row(c) for c in comments])
+            pq.write_table(table, self.output_file, compression='gzip')
+
+            reply_count = sum(1 for c in comments if c.is_reply)
+            top_level_count = len(comments) - reply_count
+
+            logger.info(f"✅ Scraping complete! Saved to {self.output_file}")
+            logger.info(f"   Total comments: {len(comments)} ({top_level_count} top-level, {reply_count} replies)")
+        except Exception as e:
+            logger.error(f"Error saving to Parquet: {e}")
+
+    def save_output(self, comments: List[Comment]):
+        """
+        Save comments in the configured output format.
+
+        Args:
+            comments: List of Comment records
+        """
+        if self.output_format == 'parquet':
+            self.save_to_parquet(comments)
+        else:
+            self.save_to_csv(comments)
     
-    def scrape(self) -> bool:
+    async def scrape_api_only(self) -> bool:
         """
-        Main scraping method with CAPTCHA handling and session management.
-        
+        Fetch comments straight from the comment-list API with httpx,
+        skipping Chromium entirely. Each page of comments costs one HTTP
+        round-trip instead of browser boot plus scrolling. Requires a saved
+        session for the msToken/web-id cookies; falls back to the full
+        browser scrape if the API refuses the requests.
+
         Returns:
             bool: True if successful, False otherwise
         """
         if not self.validate_url():
             return False
-        
-        print(f"\nStarting TikTok Comment Scraper")
-        print(f"URL: {self.url}")
-        print(f"Output: {self.output_file}")
-        print(f"Headless Mode: {self.headless}")
-        print(f"Use Session: {self.use_session}")
-        print("-" * 50)
-        
+
+        if not _HAVE_HTTPX:
+            logger.error("Error: --api-only requires httpx. Install it with: pip install httpx")
+            return False
+
+        match = re.search(r'/video/(\d+)', self.url)
+        if not match:
+            # vm./vt./t/ short links carry no video id — only the browser can
+            # resolve the redirect, so fall back as the docstring promises
+            logger.warning("Warning: No video id in the URL (short link?) — falling back to browser scrape")
+            return await self.scrape()
+        video_id = match.group(1)
+
+        # The API checks the same cookies the browser would send (msToken,
+        # tt_webid, ...); lift them from the saved storage_state
+        state = self.session_storage_state() or {}
+        cookies = {c['name']: c['value'] for c in state.get('cookies', [])
+                   if 'tiktok.com' in c.get('domain', '')}
+        if not cookies:
+            logger.warning("Warning: No saved session cookies — the API will likely refuse us.")
+            logger.warning("Run once with --solve-captcha first to warm a session.")
+
+        headers = {
+            'User-Agent': _CONTEXT_KWARGS['user_agent'],
+            'Referer': self.url,
+            'Accept': 'application/json, text/plain, */*',
+        }
+
+        logger.info(f"Fetching comments for video {video_id} via API (no browser)...")
+        rows = []
+        top_level = 0
+        cursor = 0
         try:
-            with sync_playwright() as p:
-                print("Launching browser...")
-                if not self.headless:
-                    print("ℹ️  Browser window is visible for CAPTCHA solving")
-                
-                browser = p.chromium.launch(headless=self.headless)
-                
-                # Create context with realistic settings
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York'
-                )
-                
-                # Load session if requested
-                if self.use_session:
-                    print("Loading saved session...")
-                    self.load_session(context)
-                
-                page = context.new_page()
-                
-                # Apply localStorage if available
-                if self.use_session:
-                    # Navigate first, then apply localStorage
-                    print(f"Loading TikTok video...")
+            async with httpx.AsyncClient(headers=headers, cookies=cookies, timeout=15.0) as client:
+                while True:
+                    resp = await client.get(
+                        'https://www.tiktok.com/api/comment/list/',
+                        params={'aweme_id': video_id, 'count': 50, 'cursor': cursor}
+                    )
+                    if resp.status_code != 200:
+                        logger.warning(f"Warning: Comment API returned HTTP {resp.status_code}")
+                        break
+
                     try:
-                        page.goto(self.url, wait_until='domcontentloaded', timeout=30000)
-                        self.apply_local_storage(page)
-                        # Reload to apply localStorage
-                        page.reload(wait_until='domcontentloaded', timeout=30000)
+                        payload = _load_json_bytes(resp.content)
                     except Exception as e:
-                        print(f"Warning: Error loading with session: {e}")
-                else:
-                    print(f"Navigating to video...")
+                        logger.warning(f"Warning: Could not parse API response: {e}")
+                        break
+
+                    batch = payload.get('comments') or []
+                    if not batch:
+                        break
+
+                    rows.extend(self._rows_from_api_batch(payload, top_level))
+                    top_level += len(batch)
+                    logger.debug(f"  Fetched {top_level} comments via API...")
+
+                    if not payload.get('has_more'):
+                        break
+                    cursor = int(payload.get('cursor') or cursor + len(batch))
+        except Exception as e:
+            logger.warning(f"Warning: API-only fetch failed: {e}")
+
+        if not rows:
+            logger.warning("Warning: API-only path got no comments — falling back to browser scrape")
+            return await self.scrape()
+
+        logger.info(f"✓ Fetched {top_level} top-level comments via API")
+        await asyncio.to_thread(self.save_output, rows)
+        return True
+
+    async def scrape(self, pool: Optional[BrowserPool] = None) -> bool:
+        """
+        Main scraping method with CAPTCHA handling and session management.
+
+        Args:
+            pool: Optional BrowserPool to draw a pre-warmed browser from
+                  instead of launching a fresh one
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.validate_url():
+            return False
+
+        logger.info(f"Starting TikTok Comment Scraper")
+        logger.info(f"URL: {self.url}")
+        logger.info(f"Output: {self.output_file}")
+        logger.info(f"Headless Mode: {self.headless}")
+        logger.info(f"Use Session: {self.use_session}")
+
+        if pool is not None:
+            entry = await pool.acquire()
+            broken = False
+            try:
+                if self.use_session:
+                    # Sessions are restored at context creation, so a saved
+                    # session needs a fresh context from the pooled browser
+                    return await self._scrape_with_browser(entry['browser'])
+                return await self._scrape_with_context(entry['context'])
+            except KeyboardInterrupt:
+                logger.info("Scraping interrupted by user.")
+                broken = True
+                return False
+            except Exception as e:
+                logger.error(f"Error during scraping: {e}")
+                logger.error(f"Error type: {type(e).__name__}")
+                broken = True
+                return False
+            finally:
+                await pool.release(entry, broken=broken)
+
+        try:
+            async with async_playwright() as p:
+                logger.debug("Launching browser...")
+                if not self.headless:
+                    logger.info("ℹ️  Browser window is visible for CAPTCHA solving")
+
+                if self.profile_dir:
+                    # A persistent profile lets Chromium reuse its own
+                    # cookies, IndexedDB and HTTP cache across runs, so warm
+                    # navigations skip most CSS/JS downloads entirely
+                    context = await p.chromium.launch_persistent_context(
+                        user_data_dir=self.profile_dir,
+                        headless=self.headless,
+                        args=_CHROMIUM_ARGS,
+                        **_CONTEXT_KWARGS
+                    )
+                    await _prepare_context(context)
                     try:
-                        page.goto(self.url, wait_until='networkidle', timeout=30000)
-                    except Exception as e:
-                        print(f"Warning: Page load timeout, continuing anyway: {e}")
-                        page.goto(self.url, timeout=30000)
-                
-                # Wait a bit for dynamic content with random delay
-                self.random_delay(2, 4)
-                
-                # Check if page loaded successfully
-                try:
-                    # Look for video or content indicators
-                    page.wait_for_selector('video, [data-e2e="browse-video"]', timeout=10000)
-                    print("✓ Video page loaded successfully")
-                except Exception:
-                    print("Warning: Could not verify video loaded. Attempting to continue...")
-                
-                # CLICK THE COMMENTS BUTTON (CRITICAL STEP)
-                # Note: Gracefully degrades if button not found, as UI structure may vary
-                try:
-                    self.click_comments_button(page)
-                except Exception as e:
-                    print(f"⚠️ Error clicking Comments button: {e}")
-                    print("⚠️ Note: Comment extraction may fail if Comments tab wasn't clicked")
-                
-                # WAIT A MOMENT FOR PAGE TO REACT
-                # TikTok shows CAPTCHA after clicking Comments, not on page load
-                print("Waiting for page to respond to Comments click...")
-                self.random_delay(2, 3)
-                
-                # ALWAYS PROMPT FOR CAPTCHA (NO DETECTION NEEDED)
-                # Since CAPTCHA always appears after clicking Comments, just assume it's there
-                print("\n" + "="*50)
-                print("⚠️  CAPTCHA PROMPT")
-                print("="*50)
-                print("\nTikTok typically shows a CAPTCHA verification.")
-                print("Please solve the CAPTCHA in the browser window.")
-                print("Once you have completed it, press ENTER to continue...")
-                
-                try:
-                    input()  # Wait for user to press ENTER
-                    print("\n✅ Continuing scraping...")
-                    
-                    # Save session after user confirms CAPTCHA solved
-                    print("Saving session for future use...")
-                    self.save_session(context)
-                    
-                    # Brief pause to ensure page is ready
-                    time.sleep(2)
-                except KeyboardInterrupt:
-                    print("\n\nScraping interrupted by user.")
-                    browser.close()
-                    return False
-                
-                # WAIT FOR COMMENTS SECTION TO LOAD
-                # Note: Attempts to proceed even if section not detected, for resilience
+                        return await self._scrape_with_context(context)
+                    finally:
+                        await context.close()
+
+                browser = await p.chromium.launch(headless=self.headless, args=_CHROMIUM_ARGS)
                 try:
-                    self.wait_for_comments_section(page)
-                except Exception as e:
-                    print(f"⚠️ Error waiting for comments section: {e}")
-                    print("⚠️ Note: Comment extraction may fail if section didn't load")
-                
-                # Scroll to load all comments
-                self.scroll_to_load_comments(page)
-                
-                # Extract comments
-                print("Extracting comments...")
-                self.comments = self.extract_comments(page)
-                
-                # Save session if we successfully scraped without using a session
-                if not self.use_session and self.comments:
-                    print("\nSaving session for future use...")
-                    self.save_session(context)
-                    print("💡 Tip: Use --use-session flag next time to avoid CAPTCHA")
-                
-                # Clean up
-                browser.close()
-                
-                # Save to CSV
-                if self.comments:
-                    self.save_to_csv(self.comments)
-                    return True
-                else:
-                    print("\nWarning: No comments were extracted. The video might have no comments or the page structure may have changed.")
-                    return False
-                    
+                    return await self._scrape_with_browser(browser)
+                finally:
+                    await browser.close()
+
         except KeyboardInterrupt:
-            print("\n\nScraping interrupted by user.")
+            logger.info("Scraping interrupted by user.")
             return False
         except Exception as e:
-            print(f"\nError during scraping: {e}")
-            print(f"Error type: {type(e).__name__}")
+            logger.error(f"Error during scraping: {e}")
+            logger.error(f"Error type: {type(e).__name__}")
             return False
 
+    async def _scrape_with_browser(self, browser) -> bool:
+        """
+        Run the full scrape flow against an already-launched browser.
+        Used by scrape() and by scrape_many() so concurrent scrapes can share
+        one Chromium process.
+
+        Args:
+            browser: Playwright browser object
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Restore the saved session (cookies + localStorage) at context
+        # creation, so no post-navigation reload is needed
+        storage_state = None
+        if self.use_session:
+            logger.debug("Loading saved session...")
+            storage_state = self.session_storage_state()
+
+        context = await new_scraper_context(browser, storage_state=storage_state)
+        try:
+            return await self._scrape_with_context(context)
+        finally:
+            await context.close()
+
+    async def _scrape_with_context(self, context) -> bool:
+        """
+        Run the scrape flow in an existing context.
+        The context is not closed here, so pooled contexts keep their live
+        connections to tiktok.com warm for the next scrape.
+
+        Args:
+            context: Configured Playwright browser context
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        page = await context.new_page()
+
+        # Capture comment-list API responses from the very first navigation
+        self._api_batches = []
+        page.on('response', self._maybe_capture_comments)
+
+        try:
+
+            logger.debug(f"Navigating to video...")
+            # domcontentloaded instead of networkidle: TikTok keeps analytics
+            # connections open so networkidle overshoots by seconds or times
+            # out outright. The selector wait below is the real readiness
+            # signal.
+            try:
+                await _retry_async(
+                    lambda: page.goto(self.url, wait_until='domcontentloaded', timeout=30000),
+                    label='Navigation')
+            except Exception as e:
+                logger.warning(f"Warning: Page load kept timing out, continuing anyway: {e}")
+
+            # Check if page loaded successfully
+            try:
+                # Look for video or content indicators
+                await _retry_async(
+                    lambda: page.wait_for_selector('video, [data-e2e="browse-video"]', timeout=10000),
+                    label='Video readiness wait')
+                logger.info("✓ Video page loaded successfully")
+            except Exception:
+                logger.warning("Warning: Could not verify video loaded. Attempting to continue...")
+
+            # CLICK THE COMMENTS BUTTON (CRITICAL STEP)
+            # Note: Gracefully degrades if button not found, as UI structure may vary
+            try:
+                await self.click_comments_button(page)
+            except Exception as e:
+                logger.warning(f"⚠️ Error clicking Comments button: {e}")
+                logger.warning("⚠️ Note: Comment extraction may fail if Comments tab wasn't clicked")
+
+            # DOM-DRIVEN CAPTCHA GATE
+            # TikTok shows a CAPTCHA after clicking Comments. Rather than
+            # always blocking on ENTER, poll for the comment list: with a warm
+            # session (or once the user solves the CAPTCHA in the browser
+            # window) the wrappers appear and scraping resumes on its own.
+            # The manual prompt is only the fallback after the long wait.
+            # These are interactive prompts, not logs, so they stay prints
+            # and remain visible under --quiet.
+            if not self.headless:
+                print("\n⚠️  CAPTCHA CHECK")
+                print("If TikTok shows a CAPTCHA, solve it in the browser window.")
+                print("Scraping resumes automatically once comments appear...")
+
+            # One cheap probe up front: an actual CAPTCHA overlay in headless
+            # mode can never be solved, so bail immediately instead of
+            # burning the 20s grace wait
+            captcha_up = await self._has_captcha_selector(page)
+            if not captcha_up:
+                # One-shot text heuristic as backup — never re-run in a loop,
+                # the recurring wait below is selector-based
+                captcha_up = await self._has_captcha_text(page)
+            if captcha_up:
+                logger.info("CAPTCHA overlay detected on page")
+                if self.headless:
+                    logger.error("❌ CAPTCHA detected in headless mode — it cannot be solved here.")
+                    logger.error("   Re-run with --solve-captcha to open a visible browser window,")
+                    logger.error("   then use --use-session so headless runs reuse the solved session.")
+                    return False
+
+            # Headless runs can't be solved by hand, so fail fast there
+            # instead of hanging two minutes on an unsolvable CAPTCHA
+            gate_timeout = 20000 if self.headless else 120000
+            solved_automatically = False
+            try:
+                await page.wait_for_selector(_COMMENT_WRAPPER_SEL, timeout=gate_timeout)
+                solved_automatically = True
+                logger.info("✅ Comments visible — continuing without prompt")
+            except PlaywrightTimeoutError:
+                logger.debug(f"Note: Comments did not appear within {gate_timeout // 1000}s")
+            except Exception as e:
+                logger.warning(f"Note: Error while waiting for comments: {e}")
+
+            if not solved_automatically and self.headless:
+                logger.error("❌ Comments never appeared in headless mode — likely an unsolved CAPTCHA.")
+                logger.error("   Re-run with --solve-captcha to open a visible browser window,")
+                logger.error("   then use --use-session so headless runs reuse the solved session.")
+                return False
+
+            if not solved_automatically:
+                # The lock serializes prompts so concurrent scrapes never
+                # interleave their terminal messages — only one video asks
+                # for ENTER at a time
+                async with _CAPTCHA_PROMPT_LOCK:
+                    print(f"\nPlease solve the CAPTCHA for {self.url} in the browser window.")
+                    print("Once you have completed it, press ENTER to continue...")
+                    try:
+                        # Wait for ENTER in a worker thread so the event loop stays live
+                        await asyncio.to_thread(input)
+                        logger.info("✅ Continuing scraping...")
+                    except KeyboardInterrupt:
+                        logger.info("Scraping interrupted by user.")
+                        return False
+
+            # Save session now that the CAPTCHA (if any) is behind us, so
+            # later URLs in the same batch skip the gate entirely
+            logger.info("Saving session for future use...")
+            await self.save_session(context)
+
+            # WAIT FOR COMMENTS SECTION TO LOAD
+            # Note: Attempts to proceed even if section not detected, for resilience
+            try:
+                await self.wait_for_comments_section(page)
+            except Exception as e:
+                logger.warning(f"⚠️ Error waiting for comments section: {e}")
+                logger.warning("⚠️ Note: Comment extraction may fail if section didn't load")
+
+            # Scroll, extract, and save incrementally in one streaming pass
+            saved_count = await self._collect_comments(page)
+
+            # Save session if we successfully scraped without using a session
+            if not self.use_session and saved_count:
+                logger.info("Saving session for future use...")
+                await self.save_session(context)
+                logger.info("💡 Tip: Use --use-session flag next time to avoid CAPTCHA")
+        finally:
+            await page.close()
+
+        if saved_count:
+            return True
+        else:
+            logger.warning("Warning: No comments were extracted. The video might have no comments or the page structure may have changed.")
+            return False
+
+
+async def scrape_many(urls: List[str], concurrency: int = 5, headless: bool = False,
+                      use_session: bool = False, output_dir: str = ".",
+                      output_format: str = "csv") -> Dict[str, bool]:
+    """
+    Scrape several videos concurrently, sharing one browser process.
+    Network waits dominate a single scrape, so overlapping them across videos
+    gives near-linear speedup up to the concurrency cap.
+
+    Args:
+        urls: List of TikTok video URLs
+        concurrency: Maximum number of videos scraped at once
+        headless: Run browser in headless mode
+        use_session: Load saved browser session to avoid CAPTCHA
+        output_dir: Directory for the per-video output files
+        output_format: 'csv' or 'parquet', applied to every video
+
+    Returns:
+        Dict mapping each URL to its success status
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results = {}
+
+    async with async_playwright() as p:
+        # One warm browser per concurrency slot: cold start is paid once up
+        # front instead of once per URL, and each scrape draws a pre-warmed
+        # browser from the pool
+        pool = BrowserPool(p, size=min(concurrency, len(urls)), headless=headless)
+        await pool.warmup()
+
+        async def _scrape_one(url: str):
+            async with semaphore:
+                video_id = url.rstrip('/').split('/')[-1]
+                ext = 'parquet' if output_format == 'parquet' else 'csv'
+                output_file = str(Path(output_dir) / f"comments_{video_id}.{ext}")
+                scraper = TikTokScraper(url, output_file=output_file,
+                                        headless=headless, use_session=use_session,
+                                        output_format=output_format)
+                try:
+                    results[url] = await scraper.scrape(pool=pool)
+                except Exception as e:
+                    logger.error(f"Error scraping {url}: {e}")
+                    results[url] = False
+
+        try:
+            await asyncio.gather(*(_scrape_one(url) for url in urls))
+        finally:
+            await pool.close()
+
+    return results
+
+
+async def run_daemon(socket_path: str, headless: bool = True):
+    """
+    Keep one warm Chromium alive and serve scrape requests over a Unix
+    socket, so repeated CLI invocations (cron jobs, shell loops) skip the
+    multi-second browser cold start. The protocol is JSON lines:
+    {"url": ..., "output": ..., "format": ..., "use_session": ...} in,
+    {"ok": true/false} out.
+
+    Args:
+        socket_path: Filesystem path for the Unix domain socket
+        headless: Launch the shared browser in headless mode
+    """
+    Path(socket_path).unlink(missing_ok=True)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=_CHROMIUM_ARGS)
+
+        async def handle(reader, writer):
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    ok = False
+                    try:
+                        request = _load_json_bytes(line)
+                        scraper = TikTokScraper(
+                            url=request['url'],
+                            output_file=request.get('output', 'comments.csv'),
+                            headless=headless,
+                            use_session=bool(request.get('use_session')),
+                            output_format=request.get('format', 'csv')
+                        )
+                        if scraper.validate_url():
+                            ok = await scraper._scrape_with_browser(browser)
+                    except Exception as e:
+                        logger.error(f"Error handling daemon request: {e}")
+                    # Compact single-line reply; the reader splits on newlines
+                    writer.write(json.dumps({'ok': ok}).encode('utf-8') + b'\n')
+                    await writer.drain()
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=socket_path)
+        logger.info(f"✓ Daemon ready on {socket_path} (warm Chromium, Ctrl+C to stop)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await browser.close()
+            Path(socket_path).unlink(missing_ok=True)
+
+
+async def _forward_to_daemon(socket_path: str, url: str, output: str,
+                             output_format: str, use_session: bool) -> bool:
+    """
+    Submit one scrape to a running daemon and wait for the result.
+
+    Args:
+        socket_path: Unix socket the daemon listens on
+        url: TikTok video URL
+        output: Output filename
+        output_format: 'csv' or 'parquet'
+        use_session: Load the saved session in the daemon's browser
+
+    Returns:
+        bool: True if the daemon reported success
+    """
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(json.dumps({
+            'url': url,
+            'output': output,
+            'format': output_format,
+            'use_session': use_session,
+        }).encode('utf-8') + b'\n')
+        await writer.drain()
+        line = await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    if not line:
+        return False
+    return bool(_load_json_bytes(line).get('ok'))
+
 
 def main():
     """Main entry point for the CLI."""
@@ -911,67 +1814,212 @@ Examples:
   %(prog)s --url "https://www.tiktok.com/@username/video/1234567890"
   %(prog)s --url "https://www.tiktok.com/@user/video/123" --output my_comments.csv
   %(prog)s --url "https://www.tiktok.com/@user/video/123" --use-session
-  %(prog)s --url "https://www.tiktok.com/@user/video/123" --headless
+  %(prog)s --url "https://www.tiktok.com/@user/video/123" --solve-captcha
+  %(prog)s --urls-file videos.txt --max-concurrency 5
 
 CAPTCHA Handling:
-  - Browser runs in VISIBLE mode by default (for manual CAPTCHA solving)
+  - Browser runs HEADLESS by default; use --solve-captcha for a visible window
   - When CAPTCHA appears, solve it manually in the browser window
-  - After solving, press ENTER in the terminal to continue
+  - Scraping resumes automatically once comments appear
   - Session is saved automatically after solving CAPTCHA
-  - Use --use-session on subsequent runs to avoid repeated CAPTCHAs
+  - Use --use-session on subsequent headless runs to skip CAPTCHAs
 
 Important Notes:
   - This scraper only works with PUBLIC TikTok videos
   - No login/authentication is required or supported
   - Please respect TikTok's Terms of Service
   - Use responsibly and avoid overwhelming servers with requests
-  - Built-in anti-detection features (random delays, human-like behavior)
+  - Built-in anti-detection features (realistic browser profile, webdriver hiding)
         """
     )
     
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group()
+
+    source.add_argument(
         '--url',
-        required=True,
         help='TikTok video URL (e.g., https://www.tiktok.com/@username/video/1234567890)'
     )
-    
+
+    source.add_argument(
+        '--urls-file',
+        help='Path to a text file with one TikTok video URL per line (scraped concurrently)'
+    )
+
+    source.add_argument(
+        '--urls',
+        nargs='+',
+        metavar='URL',
+        help='Several TikTok video URLs given inline (scraped concurrently)'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=5,
+        help='Maximum videos scraped at once with --urls/--urls-file (default: 5)'
+    )
+
     parser.add_argument(
         '--output',
         default='comments.csv',
         help='Output CSV filename (default: comments.csv)'
     )
     
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'parquet'],
+        default='csv',
+        help='Output format (default: csv; parquet requires pyarrow and is ~5-10x smaller on disk)'
+    )
+
     parser.add_argument(
         '--use-session',
         action='store_true',
         help='Use saved browser session to avoid CAPTCHA (load cookies from previous run)'
     )
-    
+
     parser.add_argument(
-        '--headless',
+        '--api-only',
         action='store_true',
-        help='Run browser in headless mode (not recommended - cannot solve CAPTCHA manually)'
+        help='Fetch comments via the HTTP API with httpx, skipping the browser '
+             '(needs a saved session; falls back to browser scraping on failure)'
+    )
+
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Serve scrape requests over a Unix socket with one warm Chromium '
+             '(clients forward automatically when $TIKTOK_SCRAPER_SOCKET is set)'
+    )
+
+    parser.add_argument(
+        '--socket',
+        default='/tmp/tiktok_scraper.sock',
+        help='Unix socket path for --daemon mode (default: /tmp/tiktok_scraper.sock)'
+    )
+
+    parser.add_argument(
+        '--profile-dir',
+        default=None,
+        help='Persistent Chromium profile directory (keeps cookies, IndexedDB and '
+             'HTTP cache between runs; e.g. ~/.cache/tiktok-scraper/profile)'
     )
     
+    parser.add_argument(
+        '--solve-captcha',
+        action='store_true',
+        help='Launch a visible browser window for manual CAPTCHA solving '
+             '(default: headless; combine with --use-session afterwards)'
+    )
+
+    verbosity = parser.add_mutually_exclusive_group()
+
+    verbosity.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only log warnings and errors'
+    )
+
+    verbosity.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log per-comment progress and other debug detail'
+    )
+
     args = parser.parse_args()
-    
-    # Warn if using headless mode
-    if args.headless:
-        print("\n⚠️  WARNING: Running in headless mode!")
-        print("You will NOT be able to solve CAPTCHAs manually.")
-        print("Consider running without --headless for better success rate.\n")
-    
+
+    if args.quiet:
+        level = logging.WARNING
+    elif args.verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(level=level, format='%(asctime)s %(levelname)s %(message)s')
+
+    # Headless by default: faster, works in CI/cron, and warm sessions skip
+    # the CAPTCHA anyway. --solve-captcha opts into the visible window.
+    headless = not args.solve_captcha
+    if headless and not args.use_session:
+        logger.info("ℹ️  Running headless without a saved session.")
+        logger.info("If a CAPTCHA appears the scrape will fail — solve one first with --solve-captcha.")
+
+    # Daemon mode: keep one warm Chromium and serve requests over the socket
+    if args.daemon:
+        try:
+            asyncio.run(run_daemon(args.socket, headless=headless))
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped.")
+        sys.exit(0)
+
+    if not (args.url or args.urls or args.urls_file):
+        parser.error('one of --url, --urls, --urls-file or --daemon is required')
+
+    # Batch mode: scrape every URL (from a file or inline) concurrently
+    if args.urls_file or args.urls:
+        # Fail loudly on flags batch mode cannot honor instead of dropping them
+        if args.api_only:
+            parser.error('--api-only works with a single --url, not with --urls/--urls-file')
+        if args.profile_dir:
+            parser.error('--profile-dir opens one persistent browser and cannot back a concurrent batch')
+        if args.output != 'comments.csv':
+            parser.error('--output names a single file; batch runs write comments_<video id>.<format> per video')
+
+        if args.urls_file:
+            try:
+                urls = [line.strip() for line in Path(args.urls_file).read_text().splitlines()
+                        if line.strip() and not line.startswith('#')]
+            except OSError as e:
+                logger.error(f"❌ Could not read URLs file: {e}")
+                sys.exit(1)
+        else:
+            urls = args.urls
+
+        if not urls:
+            logger.error("❌ No URLs found in file")
+            sys.exit(1)
+
+        logger.info(f"Scraping {len(urls)} videos with up to {args.max_concurrency} in parallel...")
+        results = asyncio.run(scrape_many(
+            urls,
+            concurrency=args.max_concurrency,
+            headless=headless,
+            use_session=args.use_session,
+            output_format=args.format
+        ))
+
+        failed = [url for url, ok in results.items() if not ok]
+        logger.info(f"✓ Done: {len(results) - len(failed)}/{len(results)} videos scraped successfully")
+        for url in failed:
+            logger.error(f"❌ Failed: {url}")
+        sys.exit(1 if failed else 0)
+
     # Create scraper instance
     scraper = TikTokScraper(
         url=args.url,
         output_file=args.output,
-        headless=args.headless,
-        use_session=args.use_session
+        headless=headless,
+        use_session=args.use_session,
+        output_format=args.format,
+        profile_dir=args.profile_dir
     )
-    
+
+    # A running daemon owns a warm browser — forward instead of launching
+    daemon_socket = os.environ.get('TIKTOK_SCRAPER_SOCKET')
+    if daemon_socket and not args.api_only and Path(daemon_socket).exists():
+        logger.info(f"Forwarding to scraper daemon at {daemon_socket}")
+        try:
+            success = asyncio.run(_forward_to_daemon(
+                daemon_socket, args.url, args.output, args.format, args.use_session))
+            sys.exit(0 if success else 1)
+        except OSError as e:
+            logger.warning(f"Warning: Could not reach daemon ({e}), scraping locally")
+
     # Run scraper
-    success = scraper.scrape()
-    
+    if args.api_only:
+        success = asyncio.run(scraper.scrape_api_only())
+    else:
+        success = asyncio.run(scraper.scrape())
+
     # Exit with appropriate code
     sys.exit(0 if success else 1)
 